@@ -39,6 +39,55 @@ def hijri_to_julian(dat):
             + dat.day + 1948440 - 385)
 
 
+def _days_from_civil(year, month, day):
+    '''
+    Integer-only conversion of a date to a day count (Howard Hinnant's days_from_civil),
+    the result + 0.5 is the Julian Day at 00:00 of the given date
+    '''
+    # The Gregorian calendar reform is taken into account, the day following
+    # 04 Oct. 1582 (Julian calendar) is 15 Oct. 1582 (Gregorian calendar) [3, p60]
+    julian_calendar = (year, month, day) < (1582, 10, 15)
+
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (9 if month <= 2 else -3)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    days = era * 146097 + doe + 1721119
+
+    # The Julian calendar lags behind by the skipped leap days of the centuries
+    if julian_calendar:
+        days += year // 100 - year // 400 - 2
+    return days
+
+
+def _civil_from_days(days):
+    '''
+    Inverse of `_days_from_civil`, get the (year, month, day) of a day count, the
+    days before 15 Oct. 1582 are converted to Julian calendar dates
+    '''
+    if days < 2299160:
+        # Julian calendar, the eras are 4 years (1461 days) long
+        days -= 1721117
+        era = days // 1461
+        doe = days - era * 1461
+        yoe = (doe - doe // 1460) // 365
+        doy = doe - 365 * yoe
+        year = yoe + era * 4
+    else:
+        days -= 1721119
+        era = days // 146097
+        doe = days - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        year = yoe + era * 400
+
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + (3 if mp < 10 else -9)
+    return (year + (month <= 2), month, day)
+
+
 def gregorian_to_julian(dat):
     '''
     The Julian Day (JD) is a continuous count of days and fractions from the beginning of the year -4712,
@@ -48,34 +97,23 @@ def gregorian_to_julian(dat):
     if dat is None:
         dat = datetime.now()
 
-    day, month, year = dat.day, dat.month, dat.year
-
     # This method works also for fractions of a day, however, the `date` type doesn't
     # support the fractions in the day, an alternative is to pass the datetime and the
     # time will be converted to a fraction of a day
-    if type(dat) is date:
-        pass
-    elif type(dat) is datetime:
-        day += (dat.hour + (dat.minute + (dat.second / 60)) / 60.0) / 24.0
-
-    if month <= 2:
-        month = month + 12
-        year = year - 1
-
-    a = floor(year / 100)
+    fraction = 0
+    if type(dat) is datetime:
+        fraction = (dat.hour + (dat.minute + (dat.second / 60)) / 60.0) / 24.0
 
-    # In this method, the Gregorian calendar reform is taken into account, the day
-    # following 04 Oct. 1582 (Julian calendar) is 15 Oct. 1582 (Gregorian calendar)
-    # for more information see [3, p60]
+    # The Julian Day at 00:00, plus the fraction of the day
+    return _days_from_civil(dat.year, dat.month, dat.day) + 0.5 + fraction
 
-    b = 2 - a + floor(a / 4) if year > 1582 or (year ==
-                                                1582 and (month > 10 or (month == 10 and day > 15))) else 0
 
-    # The corresponding Julian Day is:
-    jd = floor(365.25 * (year + 4716)) + \
-        floor(30.60  # In Python3, 30.6 gives a right result, no need to use 30.6001 as described in [3, p61]
-              * (month + 1)) + day + b - 1524.5
-    return jd
+def gregorian_to_julian_vec(years, months, days):
+    '''
+    Get the Julian Days (at 00:00) of a sequence of dates given as three sequences
+    of years, months and days, it gives the same results as `gregorian_to_julian`
+    '''
+    return [_days_from_civil(y, m, d) + 0.5 for y, m, d in zip(years, months, days)]
 
 
 def julian_to_hijri(julian_day, correction_val=0):
@@ -97,24 +135,7 @@ def julian_to_gregorian(jd):
     z = floor(jd)
     f = jd - z
 
-    if z < 2299161:
-        a = z
-    else:
-        alpha = floor((z - 1867216.25) / 36524.25)
-        a = z + 1 + alpha - floor((alpha / 4))
+    # `z` is the Julian Day Number (at noon), one day after the count of `_days_from_civil`
+    year, month, day = _civil_from_days(z - 1)
 
-    b = a + 1524
-    c = floor((b - 122.1) / 365.25)
-    d = floor(365.25 * c)
-    e = floor((b - d) / 30.6001)  # The 30.6001 SHOULD NOT BE REPLACED by 30.6
-
-    # Calculate the day
-    day = b - d - floor(30.6001 * e) + f
-
-    # Calculate the month
-    month = e - (1 if e < 14 else 13)
-
-    # Calculate the year
-    year = c - (4716 if month > 2 else 4715)
-
-    return (year, month, day)
+    return (year, month, day + f)
@@ -23,8 +23,9 @@ Example Usage:
 
 # -*- coding: utf-8 -*-
 
+from math import floor
 from datetime import date, timedelta
-from pyIslam.baselib import julian_to_hijri, gregorian_to_julian, hijri_to_julian, julian_to_gregorian
+from pyIslam.baselib import julian_to_hijri, gregorian_to_julian, gregorian_to_julian_vec, hijri_to_julian, julian_to_gregorian
 
 
 class HijriDate:
@@ -57,37 +58,50 @@ class HijriDate:
     month_names_en = ('Muharram', 'Safar', 'Rabi al-Awwal', 'Rabi al-Thani',
                      'Jumada al-Ula', 'Jumada al-Thania', 'Rajab', 'Shaban',
                      'Ramadan', 'Shawwal', 'Dhu al-Qada', 'Dhu al-Hijja')
+
+    # English spelling used by `format`
+    _format_names_en = ('Moharram', 'Safar', 'Rabie-I', 'Rabie-II',
+                        'Jumada-I', 'Jumada-II', 'Rajab', 'Shaban',
+                        'Ramadan', 'Shawwal', 'Delqada', 'Delhijja')
     
     def __init__(self, year, month, day):  # Constructor
-        if isinstance(year, int):
-            if year < 0:
-                raise ValueError('year must be positive')
-            else:
-                self.year = year
-        else:
+        if type(year) is not int:
             raise TypeError('year must be an int')
+        if year < 0:
+            raise ValueError('year must be positive')
 
-        if isinstance(month, int):
-            if not (month in range(1, 13)):
-                raise ValueError('month should be bitween 1 and 12')
-            else:
-                self.month = month
-        else:
+        if type(month) is not int:
             raise TypeError('month must be an int')
+        if not 1 <= month <= 12:
+            raise ValueError('month should be bitween 1 and 12')
 
-        if isinstance(day, int):
-            if not (month in range(1, 31)):
-                raise ValueError('day should be bitween 1 and 30')
-            else:
-                self.day = day
-        else:
+        if type(day) is not int:
             raise TypeError('day must be an int')
+        if not 1 <= day <= 30:
+            raise ValueError('day should be bitween 1 and 30')
 
+        self.year = year
+        self.month = month
+        self.day = day
         self._julian = hijri_to_julian(self)
 
+    @classmethod
+    def _from_parts_and_julian(cls, year, month, day, jd):
+        '''
+        Build a HijriDate from parts returned by `julian_to_hijri` and their Julian day,
+        skipping the validation and the `hijri_to_julian` call of the constructor
+        '''
+        if year < 0:
+            raise ValueError('year must be positive')
+
+        hd = cls.__new__(cls)
+        hd.year, hd.month, hd.day = year, month, day
+        hd._julian = jd
+        return hd
+
     def __sub__(self, value):  # Return date dalta, self - value
         if isinstance(value, HijriDate):
-            return timedelta(self._julian - hijri_to_julian(value))
+            return timedelta(self._julian - value._julian)
         else:
             raise TypeError("unsupported operand type(s) for -: %s and %s"
                             % (str(type(self)), str(type(value))))
@@ -110,39 +124,14 @@ class HijriDate:
 
         if not isinstance(lang, int):
             raise TypeError('lang should be an int')
-        elif not (lang in range(0, 3)):
+        elif not 0 <= lang <= 2:
             raise ValueError('lang should be bitween 0 and 2')
 
-        month_name = {1: (u'محرم',
-                          u'صفر',
-                          u'ربيع الأول',
-                          u'ربيع الثاني',
-                          u'جمادى الأولى',
-                          u'جمادى الثانية',
-                          u'رجب',
-                          u'شعبان',
-                          u'رمضان',
-                          u'شوال',
-                          u'ذو القعدة',
-                          u'ذو الحجة'),
-                      2: ('Moharram',
-                          'Safar',
-                          'Rabie-I',
-                          'Rabie-II',
-                          'Jumada-I',
-                          'Jumada-II',
-                          'Rajab',
-                          'Shaban',
-                          'Ramadan',
-                          'Shawwal',
-                          'Delqada',
-                          'Delhijja')}
-
         if lang == 0:  # Numeric Format
-            return '%02d-%02d-%04d' % (self.day, self.month, self.year)
+            return f'{self.day:02d}-{self.month:02d}-{self.year:04d}'
 
-        return '%s %s %s' % (str(self.day), month_name[lang][self.month - 1],
-                             str(self.year))
+        names = self.month_names if lang == 1 else self._format_names_en
+        return f'{self.day} {names[self.month - 1]} {self.year}'
 
     @staticmethod
     def today(correction_val=0):
@@ -151,13 +140,31 @@ class HijriDate:
     @staticmethod
     def from_julian(jd, correction_val=0):
         hd = julian_to_hijri(jd, correction_val)
-        return HijriDate(hd[0], hd[1], hd[2])
+        # `hijri_to_julian` of the result is always floor(jd + correction_val)
+        return HijriDate._from_parts_and_julian(hd[0], hd[1], hd[2],
+                                                floor(jd + correction_val))
 
     @staticmethod
     def get_hijri(dat, correction_val=0):
         '''get hijri date from gregorian date "dat"'''
         if isinstance(dat, date):
-            hd = julian_to_hijri(gregorian_to_julian(dat), correction_val)
-            return HijriDate(hd[0], hd[1], hd[2])
+            return HijriDate.from_julian(gregorian_to_julian(dat), correction_val)
         else:
             raise TypeError("dat is not a 'date' object")
+
+    @staticmethod
+    def get_hijri_batch(dates, correction_val=0):
+        '''
+        get the hijri dates of a sequence of gregorian dates "dates",
+        the time part of `datetime` objects is ignored
+        @return: a list of HijriDate (same order as `dates`)
+        '''
+        # `dates` may be a one-shot iterable (e.g. a generator), it is read several times below
+        dates = list(dates)
+        if not all(isinstance(dat, date) for dat in dates):
+            raise TypeError("dates should contain only 'date' objects")
+
+        jds = gregorian_to_julian_vec([dat.year for dat in dates],
+                                      [dat.month for dat in dates],
+                                      [dat.day for dat in dates])
+        return [HijriDate.from_julian(jd, correction_val) for jd in jds]
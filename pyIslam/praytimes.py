@@ -2,9 +2,11 @@
 
 from math import pi, atan, sqrt, tan, floor
 from datetime import time, datetime
+from functools import lru_cache
+from bisect import bisect_right
+from array import array
 from pyIslam.hijri import HijriDate
-from pyIslam.baselib import dcos, dsin, equation_of_time, gregorian_to_julian
-from math import *
+from pyIslam.baselib import dcos, dsin, equation_of_time, gregorian_to_julian, hijri_to_julian, julian_to_hijri
 
 
 class FixedTime():
@@ -56,6 +58,13 @@ class MethodInfo:
         self._applicability = applicability if type(
             applicability) in (list, tuple) else (applicability,)
 
+        # Cosines of the sun angles (the angle + 90°) used in the prayer calculations,
+        # computed once per method instead of once per PrayerConf
+        self._cos_fajr = None if isinstance(
+            fajr_angle, FixedTime) else dcos(fajr_angle + 90.0)
+        self._cos_ishaa = None if isinstance(
+            ishaa_angle, FixedTime) else dcos(ishaa_angle + 90.0)
+
     @property
     def id(self):
         return self._id
@@ -114,6 +123,12 @@ LIST_FAJR_ISHA_METHODS = (
 
 )
 
+_METHOD_BY_ID = {method.id: method for method in LIST_FAJR_ISHA_METHODS}
+
+# Sun angle of Sherook and Maghreb, and its cosine
+_SUNSET_ANGLE = 90.83333
+_COS_SUNSET_ANGLE = dcos(_SUNSET_ANGLE)
+
 
 class PrayerConf:
     """
@@ -147,8 +162,8 @@ class PrayerConf:
         self.longitude = longitude
         self.latitude = latitude
         self.timezone = timezone
-        self.sherook_angle = 90.83333  # Constants
-        self.maghreb_angle = 90.83333
+        self.sherook_angle = _SUNSET_ANGLE  # Constants
+        self.maghreb_angle = _SUNSET_ANGLE
 
         # 1 = Jomhor (Shafii, Maliki & Hambali), 2 = Hanafi
         self.asr_madhab = asr_madhab if asr_madhab == 2 else 1
@@ -159,21 +174,196 @@ class PrayerConf:
 
         self.summer_time = enable_summer_time
 
-        global LIST_FAJR_ISHA_METHODS
-
         if isinstance(angle_ref, int):
-            method = LIST_FAJR_ISHA_METHODS[angle_ref -
-                                            1 if angle_ref <= len(LIST_FAJR_ISHA_METHODS) else 2]
+            # Unknown IDs fall back to the default method
+            method = _METHOD_BY_ID.get(angle_ref, _METHOD_BY_ID[2])
         elif isinstance(angle_ref, MethodInfo):
             method = angle_ref
         else:
             raise TypeError(
                 "angle_ref must be an instance form type int or MethodInfo")
 
-        self.fajr_angle = (method.fajr_angle +
-                           90.0) if type(method.fajr_angle) is not FixedTime else method.fajr_angle
-        self.ishaa_angle = (method.ishaa_angle +
-                            90.0) if type(method.ishaa_angle) is not FixedTime else method.ishaa_angle
+        self._fajr_is_fixed = isinstance(method.fajr_angle, FixedTime)
+        self._ishaa_is_fixed = isinstance(method.ishaa_angle, FixedTime)
+
+        self.fajr_angle = method.fajr_angle if self._fajr_is_fixed else method.fajr_angle + 90.0
+        self.ishaa_angle = method.ishaa_angle if self._ishaa_is_fixed else method.ishaa_angle + 90.0
+
+        # Fixed Ishaa intervals after Maghreb (in hours), unused if Ishaa has an angle
+        if self._ishaa_is_fixed:
+            self._ishaa_ramadan_hr = float(self.ishaa_angle.ramadan_time_hr)
+            self._ishaa_allyear_hr = float(self.ishaa_angle.all_year_time_hr)
+        else:
+            self._ishaa_ramadan_hr = self._ishaa_allyear_hr = 0.0
+
+        # The latitude and the angles never change after construction, so their
+        # trigonometric values are computed once here instead of for each prayer
+        self._sin_lat = dsin(self.latitude)
+        self._cos_lat = dcos(self.latitude)
+        self._cos_fajr = method._cos_fajr
+        self._cos_ishaa = 0.0 if self._ishaa_is_fixed else method._cos_ishaa
+        self._cos_sherook = _COS_SUNSET_ANGLE
+        self._cos_maghreb = _COS_SUNSET_ANGLE
+
+
+# Both depend only on the Julian day, so they are shared by every PrayerConf
+@lru_cache(maxsize=4096)
+def _sun_declination(jd):
+    '''Get sun declination'''
+    n = jd - 2451544.5
+    epsilon = 23.44 - 0.0000004 * n
+    l = 280.466 + 0.9856474 * n
+    g = 357.528 + 0.9856003 * n
+    lamda = l + 1.915 * dsin(g) + 0.02 * dsin(2 * g)
+    x = dsin(epsilon) * dsin(lamda)
+    return (180 / (4 * atan(1))) * atan(x / sqrt(-x * x + 1))
+
+
+_equation_of_time = lru_cache(maxsize=4096)(equation_of_time)
+
+
+def precompute_range(jd_start, jd_end):
+    '''
+    Fill the sun declination and equation of time caches for every day from
+    `jd_start` to `jd_end` (inclusive), useful for servers computing prayer times
+    for many locations on the same dates
+    @param jd_start: first Julian day (as returned by `gregorian_to_julian`)
+    @param jd_end: last Julian day
+    '''
+    for i in range(int(jd_end - jd_start) + 1):
+        _sun_declination(jd_start + i)
+        _equation_of_time(jd_start + i)
+
+
+def _time_for_angle_fast(cos_angle, sl_sd, cl_cd):
+    '''
+    Get Times for "Fajr, Sherook, Asr, Maghreb, ishaa"
+    @param cos_angle: cosine of the angle
+    @param sl_sd: sin(latitude) * sin(declination)
+    @param cl_cd: cos(latitude) * cos(declination)
+    '''
+    s = (cos_angle - sl_sd) / cl_cd
+    return (180 / pi * (atan(-s / sqrt(-s * s + 1)) + pi / 2)) / 15
+
+
+def _get_asr_angle(asr_madhab, sl_sd, cl_cd):
+    '''Get the angle angle for asr (according to choosed asr fiqh)'''
+    x = sl_sd + cl_cd
+    a = atan(x / sqrt(-x * x + 1))
+    x = asr_madhab + (1 / tan(a))
+    return 90 - (180 / pi) * (atan(x) + 2 * atan(1))
+
+
+def _get_dohr_time(jd, longitude_difference):
+    '''
+    # Dohr time for internal use, return number of hours, not time object
+    '''
+    time_eq = _equation_of_time(jd)
+    return 12 + longitude_difference + time_eq / 60
+
+
+def _compute_all_times(jd, sin_lat, cos_lat, lon_diff, cos_fajr, cos_ishaa,
+                       cos_sherook, cos_maghreb, asr_madhab, ishaa_is_fixed, ishaa_fixed_hr):
+    '''
+    Compute the prayer times (in hours) of the Julian day `jd`, this function
+    takes only plain numbers, so it does no attribute lookups on the configuration
+    @param sin_lat, cos_lat: sine and cosine of the latitude
+    @param cos_fajr, cos_ishaa, cos_sherook, cos_maghreb: cosines of the angles
+    @param ishaa_is_fixed: True if Ishaa is a fixed interval after Maghreb
+    @param ishaa_fixed_hr: the interval (in hours) after Maghreb, used only when `ishaa_is_fixed`
+    @return: the tuple (fajr, sherook, dohr, asr, maghreb, ishaa)
+    '''
+    # Dohr time MUST BE calculated at first, every other time depends on it!
+    dohr = _get_dohr_time(jd, lon_diff)
+    delta = _sun_declination(jd)
+
+    # These products are shared by every angle of the day
+    sl_sd = sin_lat * dsin(delta)
+    cl_cd = cos_lat * dcos(delta)
+
+    maghreb_t = _time_for_angle_fast(cos_maghreb, sl_sd, cl_cd)
+
+    if ishaa_is_fixed:
+        ishaa = ishaa_fixed_hr + dohr + maghreb_t
+    else:
+        ishaa = dohr + _time_for_angle_fast(cos_ishaa, sl_sd, cl_cd)
+
+    cos_asr = dcos(_get_asr_angle(asr_madhab, sl_sd, cl_cd))
+
+    return (dohr - _time_for_angle_fast(cos_fajr, sl_sd, cl_cd),
+            dohr - _time_for_angle_fast(cos_sherook, sl_sd, cl_cd),
+            dohr,
+            dohr + _time_for_angle_fast(cos_asr, sl_sd, cl_cd),
+            dohr + maghreb_t,
+            ishaa)
+
+
+# Julian days of the first day of Ramadan and of Shawwal, for the Hijri years 1300 to 1599
+_RAMADAN_STARTS = tuple(hijri_to_julian(HijriDate(year, 9, 1))
+                        for year in range(1300, 1600))
+_RAMADAN_ENDS = tuple(hijri_to_julian(HijriDate(year, 10, 1))
+                      for year in range(1300, 1600))
+
+
+def _is_ramadan(jd, correction_val):
+    '''Check if the (integer) Julian day `jd` is in Ramadan'''
+    jd += correction_val
+    if not _RAMADAN_STARTS[0] <= jd < _RAMADAN_ENDS[-1]:
+        return julian_to_hijri(jd)[1] == 9
+
+    i = bisect_right(_RAMADAN_STARTS, jd) - 1
+    return i >= 0 and jd < _RAMADAN_ENDS[i]
+
+
+def _conf_times(conf, jd, correction_val):
+    '''Call `_compute_all_times` with the parameters of the PrayerConf `conf`'''
+    # When both intervals are the same, there is no need to know if it is Ramadan
+    if (conf._ishaa_is_fixed and conf._ishaa_ramadan_hr != conf._ishaa_allyear_hr
+            and _is_ramadan(floor(jd), correction_val)):
+        ishaa_fixed_hr = conf._ishaa_ramadan_hr
+    else:
+        ishaa_fixed_hr = conf._ishaa_allyear_hr
+
+    return _compute_all_times(jd, conf._sin_lat, conf._cos_lat, conf.longitude_difference,
+                              conf._cos_fajr, conf._cos_ishaa, conf._cos_sherook, conf._cos_maghreb,
+                              conf.asr_madhab, conf._ishaa_is_fixed, ishaa_fixed_hr)
+
+
+_PRAYER_NAMES = ('fajr', 'sherook', 'dohr', 'asr', 'maghreb', 'ishaa')
+
+
+def compute_prayer_times_vec(conf, jds, correction_val=0):
+    '''
+    Compute the prayer times for a sequence of Julian days in a single pass,
+    this is the batch counterpart of `Prayer`, useful to get a month or a year of
+    prayer times without creating a `Prayer` object for each day
+    @param conf: a PrayerConf object
+    @param jds: an iterable of Julian days (as returned by `gregorian_to_julian`)
+    @param correction_val: Hijri date correction (in days), used for Ramadan detection
+    @return: a dict mapping "fajr", "sherook", "dohr", "asr", "maghreb" and "ishaa"
+    to arrays (of type 'h') of minutes from midnight (same order as `jds`), the
+    summer time is applied, and the seconds are truncated like in `Prayer`
+    '''
+    if not (correction_val in range(-2, 3)):
+        raise Exception('Correction value exception')
+
+    st_offset_s = 3600 if conf.summer_time else 0
+    times = {name: array('h') for name in _PRAYER_NAMES}
+    columns = tuple(times[name] for name in _PRAYER_NAMES)
+
+    for jd in jds:
+        for col, val in zip(columns, _conf_times(conf, jd, correction_val)):
+            col.append((floor(val * 3600) + st_offset_s) % 86400 // 60)
+
+    return times
+
+
+def format_prayer_times_vec(times):
+    '''
+    Convert the result of `compute_prayer_times_vec` to lists of "HH:MM" strings
+    '''
+    return {name: ['%02d:%02d' % divmod(minutes, 60) for minutes in col]
+            for name, col in times.items()}
 
 
 class Prayer:
@@ -209,46 +399,12 @@ class Prayer:
         else:
             self._correction_val = correction_val
 
-        # Dohr time MUST BE calculated at first, every other time depends on it!
-        self._dohr_time = self._get_dohr_time()
-
-        self._fajr_time = self._get_fajr_time()
-        self._sherook_time = self._get_sherook_time()
-        self._asr_time = self._get_asr_time()
-        self._maghreb_time = self._get_maghreb_time()
-        self._ishaa_time = self._get_ishaa_time()
-
-        # These HAVE TO BE called AFTER Ishaa, since they depends on it
-        self._midnight = self._get_midnight()
-        self._second_third_of_night = self._get_second_third_of_night()
-        self._last_third_of_night = self._get_last_third_of_night()
-
-    def _get_asr_angle(self):
-        '''Get the angle angle for asr (according to choosed asr fiqh)'''
-        delta = self._sun_declination()
-        x = (dsin(self._conf.latitude) * dsin(delta)
-             + dcos(self._conf.latitude) * dcos(delta))
-        a = atan(x / sqrt(-x * x + 1))
-        x = self._conf.asr_madhab + (1 / tan(a))
-        return 90 - (180 / pi) * (atan(x) + 2 * atan(1))
-
-    def _sun_declination(self):
-        '''Get sun declination'''
-        n = self._jd - 2451544.5
-        epsilon = 23.44 - 0.0000004 * n
-        l = 280.466 + 0.9856474 * n
-        g = 357.528 + 0.9856003 * n
-        lamda = l + 1.915 * dsin(g) + 0.02 * dsin(2 * g)
-        x = dsin(epsilon) * dsin(lamda)
-        return (180 / (4 * atan(1))) * atan(x / sqrt(-x * x + 1))
-
-    def _get_time_for_angle(self, angle):
-        '''Get Times for "Fajr, Sherook, Asr, Maghreb, ishaa"'''
-        delta = self._sun_declination()
-        s = ((dcos(angle)
-              - dsin(self._conf.latitude) * dsin(delta))
-             / (dcos(self._conf.latitude) * dcos(delta)))
-        return (180 / pi * (atan(-s / sqrt(-s * s + 1)) + pi / 2)) / 15
+        # Summer time shift, in seconds
+        self._st_offset_s = 3600 if self._conf.summer_time else 0
+
+        (self._fajr_time, self._sherook_time, self._dohr_time,
+         self._asr_time, self._maghreb_time, self._ishaa_time) = _conf_times(
+            self._conf, self._jd, self._correction_val)
 
     def _hours_to_time(self, val, shift):
         '''
@@ -260,15 +416,12 @@ class Prayer:
         if not (isinstance(shift, float) or isinstance(shift, int)):
             raise ValueError("shift's value must be an int or a float")
 
-        st = 1 if self._conf.summer_time else 0
-
-        hours = val + shift / 3600
-        minutes = (hours - floor(hours)) * 60
-        seconds = (minutes - floor(minutes)) * 60
+        # Truncate to whole seconds, then split them into hours, minutes and seconds
+        total_s = (floor(val * 3600 + shift) + self._st_offset_s) % 86400
+        hours, rem = divmod(total_s, 3600)
+        minutes, seconds = divmod(rem, 60)
 
-        hours = floor(hours + st) % 24
-
-        return time(hours, floor(minutes), floor(seconds))
+        return time(hours, minutes, seconds)
 
     def fajr_time(self, shift=0.0):
         '''
@@ -277,9 +430,6 @@ class Prayer:
         '''
         return self._hours_to_time(self._fajr_time, shift)
 
-    def _get_fajr_time(self):
-        return self._dohr_time - self._get_time_for_angle(self._conf.fajr_angle)
-
     def sherook_time(self, shift=0.0):
         '''
         Get the Sunrise (Sherook) time
@@ -287,9 +437,6 @@ class Prayer:
         '''
         return self._hours_to_time(self._sherook_time, shift)
 
-    def _get_sherook_time(self):
-        return self._dohr_time - self._get_time_for_angle(self._conf.sherook_angle)
-
     def dohr_time(self, shift=0.0):
         '''
         Get the Dohr (Zenith) time
@@ -297,15 +444,6 @@ class Prayer:
         '''
         return self._hours_to_time(self._dohr_time, shift)
 
-    def _get_dohr_time(self):
-        '''
-        # Dohr time for internal use, return number of hours, not time object
-        '''
-        ld = self._conf.longitude_difference
-        time_eq = equation_of_time(self._jd)
-        duhr_t = 12 + ld + time_eq / 60
-        return duhr_t
-
     def asr_time(self, shift=0.0):
         '''
         Get the Asr time
@@ -313,9 +451,6 @@ class Prayer:
         '''
         return self._hours_to_time(self._asr_time, shift)
 
-    def _get_asr_time(self):
-        return self._dohr_time + self._get_time_for_angle(self._get_asr_angle())
-
     def maghreb_time(self, shift=0.0):
         '''
         Get the Maghreb time
@@ -323,9 +458,6 @@ class Prayer:
         '''
         return self._hours_to_time(self._maghreb_time, shift)
 
-    def _get_maghreb_time(self):
-        return self._dohr_time + self._get_time_for_angle(self._conf.maghreb_angle)
-
     def ishaa_time(self, shift=0.0):
         '''
         Get the Ishaa time
@@ -333,32 +465,19 @@ class Prayer:
         '''
         return self._hours_to_time(self._ishaa_time, shift)
 
-    def _get_ishaa_time(self):
-        if (type(self._conf.ishaa_angle) is FixedTime):
-            is_ramadan = HijriDate.get_hijri(
-                self._date, self._correction_val).month == 9
-
-            time_after_maghreb = self._conf.ishaa_angle.ramadan_time_hr if is_ramadan else self._conf.ishaa_angle.all_year_time_hr
-
-            ishaa_t = (time_after_maghreb + self._dohr_time +
-                       self._get_time_for_angle(self._conf.maghreb_angle))
-        else:
-            ishaa_t = self._dohr_time + \
-                self._get_time_for_angle(self._conf.ishaa_angle)
-        return ishaa_t
-
     def midnight(self, shift=0.0):
         '''
         Midnight is the exact time between sunrise (Shorook) and sunset (Maghreb),
         It defines usually the end of Ishaa time
         '''
-        return self._hours_to_time(self._midnight, shift)
+        return self._hours_to_time(self._get_midnight(), shift)
 
+    # The night times are rarely needed, so they are computed on demand
     def _get_midnight(self):
         return self._maghreb_time + ((24.0 - (self._maghreb_time - self._fajr_time)) / 2.0)
 
     def second_third_of_night(self, shift=0.0):
-        return self._hours_to_time(self._second_third_of_night, shift)
+        return self._hours_to_time(self._get_second_third_of_night(), shift)
 
     def _get_second_third_of_night(self):
         return self._maghreb_time + ((24.0 - (self._maghreb_time - self._fajr_time)) / 3.0)
@@ -367,7 +486,7 @@ class Prayer:
         '''
         Qiyam time starts after Ishaa directly, however, the best time for Qiyam is the last third of night
         '''
-        return self._hours_to_time(self._last_third_of_night, shift)
+        return self._hours_to_time(self._get_last_third_of_night(), shift)
 
     def _get_last_third_of_night(self):
         # The last third of night,
@@ -15,8 +15,29 @@ Example Usage:
     direction = qiblah.get_qiblah()  # Returns direction in degrees from true north
 """
 
-from math import pi, atan, acos, asin
-from pyIslam.baselib import dcos, dsin, normalize
+from math import atan2, degrees
+from functools import lru_cache
+from pyIslam.baselib import dcos, dsin
+
+
+MAKKAH_LATI = 21.42249   # latitude taken from maps.google.com
+MAKKAH_LONG = 39.826174  # longitude taken from maps.google.com
+
+
+@lru_cache(maxsize=8192)
+def _qiblah_dir(latitude, longitude):
+    '''
+    Get the Qiblah direction (in degrees) from the given location, the callers round the
+    coordinates to 3 decimals (~100m), so nearby users share the same cached result
+    '''
+    lamda = MAKKAH_LONG - longitude
+    num = dcos(MAKKAH_LATI) * dsin(lamda)
+    denom = (dsin(MAKKAH_LATI) * dcos(latitude)
+             - dcos(MAKKAH_LATI) * dsin(latitude)
+             * dcos(lamda))
+    # atan2 resolves the quadrant, and works even if `denom` is 0
+    qiblah_dir = degrees(atan2(num, denom)) % 360
+    return qiblah_dir
 
 
 class Qiblah:
@@ -38,31 +59,19 @@ class Qiblah:
     
     def __init__(self, conf):
         self._conf = conf
-        MAKKAH_LATI = 21.42249   # latitude taken from maps.google.com
-        MAKKAH_LONG = 39.826174  # longitude taken from maps.google.com
-        lamda = MAKKAH_LONG - self._conf.longitude
-        num = dcos(MAKKAH_LATI) * dsin(lamda)
-        denom = (dsin(MAKKAH_LATI) * dcos(self._conf.latitude)
-                 - dcos(MAKKAH_LATI) * dsin(self._conf.latitude)
-                 * dcos(lamda))
-        self._qiblah_dir = (180 / pi) * atan(num / denom)
-        
-        # Needs a check!
-        if denom < 0:
-            self._qiblah_dir = 180 + self._qiblah_dir
-        if denom > 0 and num < 0:
-            self._qiblah_dir = 360 + self._qiblah_dir
+        self._qiblah_dir = _qiblah_dir(round(self._conf.latitude, 3),
+                                       round(self._conf.longitude, 3))
 
     def direction(self):
         '''Get the direction from the north of the qiblah (in degrees)'''
         return self._qiblah_dir
 
-    def sixty(self):  # Convert the angle from degrees to sixty
-        six = str(int(self._qiblah_dir)) + '°'
-        self._qiblah_dir = (self._qiblah_dir - int(self._qiblah_dir)) * 60
-        six = six + " " + str(int(self._qiblah_dir)) + "'"
-        self._qiblah_dir = (self._qiblah_dir - int(self._qiblah_dir)) * 60
-        six = six + " " + str(int(self._qiblah_dir)) + "''"
-        self._qiblah_dir = (self._qiblah_dir - int(self._qiblah_dir)) * 60
-        return six
-
+    def sixty(self):
+        '''Convert the direction from degrees to sexagesimal (degrees, minutes, seconds.milliseconds)'''
+        # Work on an integer count of milliseconds of arc, so no float rounding happens
+        # between the parts, and the stored direction is left untouched
+        millis = int(round(self._qiblah_dir * 3600000))
+        deg, rem = divmod(millis, 3600000)
+        mn, rem = divmod(rem, 60000)
+        sec, ms = divmod(rem, 1000)
+        return f"{deg}° {mn}' {sec}.{ms:03d}''"
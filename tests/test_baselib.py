@@ -3,6 +3,7 @@
 from datetime import date, datetime
 from pyIslam.baselib import (
     gregorian_to_julian,
+    gregorian_to_julian_vec,
     dcos,
     dsin,
     equation_of_time,
@@ -42,6 +43,21 @@ def test_gregorian_to_julian():
     assert gregorian_to_julian(datetime(2000, 1, 1, 12, 00, 00)) == 2451545.0
     assert gregorian_to_julian(date(1600, 1, 1)) == 2305447.5
     assert gregorian_to_julian(date(1900, 1, 1)) == 2415020.5
+    # the day following 04 Oct. 1582 (Julian calendar) is 15 Oct. 1582 (Gregorian calendar)
+    assert gregorian_to_julian(date(1582, 10, 4)) == 2299159.5
+    assert gregorian_to_julian(date(1582, 10, 15)) == 2299160.5
+
+
+def test_gregorian_to_julian_vec():
+    assert gregorian_to_julian_vec([1600, 1900, 333, 1582, 1582],
+                                   [1, 1, 1, 10, 10],
+                                   [1, 1, 27, 15, 16]) == [
+        gregorian_to_julian(date(1600, 1, 1)),
+        gregorian_to_julian(date(1900, 1, 1)),
+        gregorian_to_julian(date(333, 1, 27)),
+        gregorian_to_julian(date(1582, 10, 15)),
+        gregorian_to_julian(date(1582, 10, 16)),
+    ]
 
 
 # Todo: use an internal type for date/datetime, to add support of negative years
@@ -59,3 +75,5 @@ def test_julian_to_hijri():
 def test_julian_to_gregorian():
     assert julian_to_gregorian(2459313) == (2021, 4, 13)
     assert julian_to_gregorian(2415020.5) == (1900, 1, 5.5)
+    assert julian_to_gregorian(2299155) == (1582, 10, 4)
+    assert julian_to_gregorian(2299156) == (1582, 10, 15)
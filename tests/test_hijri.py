@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+import pytest
+
 from pyIslam.hijri import HijriDate
 
 
@@ -22,3 +24,30 @@ def test_hijri():
 
     assert hijri_from_gregorian.format(2) == "25 Shaban 1442"
     assert hijri_from_julian.format(2) == "25 Shaban 1442"
+
+    assert tomorrow - hijri_date == timedelta(1)
+    assert hijri_from_gregorian - hijri_date == timedelta(0)
+    assert hijri_from_julian.to_gregorian() == gregorian
+
+
+def test_hijri_batch():
+    dates = [date(2021, 4, 9) + timedelta(i) for i in range(400)]
+    batch = HijriDate.get_hijri_batch(dates, 1)
+
+    assert [h.format() for h in batch] == [
+        HijriDate.get_hijri(d, 1).format() for d in dates]
+
+    # one-shot iterables are accepted too
+    assert [h.format() for h in HijriDate.get_hijri_batch(d for d in dates)] == [
+        HijriDate.get_hijri(d).format() for d in dates]
+
+
+def test_hijri_invalid():
+    with pytest.raises(ValueError):
+        HijriDate(1442, 13, 1)
+    with pytest.raises(ValueError):
+        HijriDate(1442, 8, 31)
+    with pytest.raises(ValueError):
+        HijriDate(1442, 8, 0)
+    with pytest.raises(TypeError):
+        HijriDate(1442, 8, 1.0)
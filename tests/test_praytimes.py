@@ -2,9 +2,12 @@
 
 from datetime import date
 
+from pyIslam.baselib import gregorian_to_julian
 from pyIslam.praytimes import (
     PrayerConf,
     Prayer,
+    compute_prayer_times_vec,
+    format_prayer_times_vec,
 )
 
 
@@ -67,3 +70,61 @@ def test_praytimes_jakarta_fixed_interval():
     assert str(prayer_time.second_third_of_night()) == "21:29:01"  # 1 st third
     assert str(prayer_time.midnight()) == "23:16:25"  # midnight
     assert str(prayer_time.last_third_of_night()) == "01:03:49"  # qiyam
+
+
+def test_praytimes_vec_matches_prayer():
+    # jakarta
+    latitude = -6.18233995
+    longitude = 106.84287154
+    timezone = 7  # GMT+7
+    dates = [date(2021, 4, d) for d in range(1, 31)]
+
+    for fajr_isha_method in (4, 7):
+        prayer_conf = PrayerConf(longitude, latitude, timezone, fajr_isha_method, 1)
+        times = compute_prayer_times_vec(
+            prayer_conf, [gregorian_to_julian(d) for d in dates])
+        strings = format_prayer_times_vec(times)
+
+        for i, dat in enumerate(dates):
+            prayer_time = Prayer(prayer_conf, dat)
+            for name, method in (('fajr', prayer_time.fajr_time),
+                                 ('sherook', prayer_time.sherook_time),
+                                 ('dohr', prayer_time.dohr_time),
+                                 ('asr', prayer_time.asr_time),
+                                 ('maghreb', prayer_time.maghreb_time),
+                                 ('ishaa', prayer_time.ishaa_time)):
+                t = method()
+                assert times[name][i] == t.hour * 60 + t.minute
+                assert strings[name][i] == t.strftime('%H:%M')
+
+
+def test_praytimes_unknown_method_uses_default():
+    default_conf = PrayerConf(106.84287154, -6.18233995, 7)
+    prayer_conf = PrayerConf(106.84287154, -6.18233995, 7, 42)
+
+    assert prayer_conf.fajr_angle == default_conf.fajr_angle
+    assert prayer_conf.ishaa_angle == default_conf.ishaa_angle
+
+
+def test_praytimes_umm_alqura_ramadan_boundaries():
+    # Umm al-Qura adds 120 min after Maghreb in Ramadan, 90 min otherwise
+    prayer_conf = PrayerConf(106.84287154, -6.18233995, 7, 4, 1)
+
+    def ishaa_interval(dat, correction_val=0):
+        prayer_time = Prayer(prayer_conf, dat, correction_val)
+        return round((prayer_time._ishaa_time - prayer_time._maghreb_time) * 60)
+
+    # with the arithmetic calendar, 1 Ramadan 1442 is 2021-04-14 and 1 Shawwal is 2021-05-14
+    assert ishaa_interval(date(2021, 4, 13)) == 90
+    assert ishaa_interval(date(2021, 4, 14)) == 120
+    assert ishaa_interval(date(2021, 5, 13)) == 120
+    assert ishaa_interval(date(2021, 5, 14)) == 90
+
+    # with one day of correction, 1 Ramadan 1442 is 2021-04-13 and 1 Shawwal is 2021-05-13
+    assert ishaa_interval(date(2021, 4, 12), 1) == 90
+    assert ishaa_interval(date(2021, 4, 13), 1) == 120
+    assert ishaa_interval(date(2021, 5, 13), 1) == 90
+
+    # 1299 AH is outside the precomputed Ramadan table
+    assert ishaa_interval(date(1882, 8, 16)) == 120  # 30 Ramadan 1299
+    assert ishaa_interval(date(1882, 8, 17)) == 90  # 1 Shawwal 1299
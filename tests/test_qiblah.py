@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import pytest
+
 from pyIslam.praytimes import PrayerConf
 from pyIslam.qiblah import Qiblah
 
@@ -14,4 +16,11 @@ def test_qiblah_jakarta():
     asr_fiqh = 1  # Jomhor
     prayer_conf = PrayerConf(longitude, latitude, timezone, fajr_isha_method, asr_fiqh)
 
-    assert Qiblah(prayer_conf).sixty() == "295° 8' 39''"
+    qiblah = Qiblah(prayer_conf)
+
+    # the coordinates are rounded to 3 decimals (~100m) before the calculation
+    assert qiblah.sixty() == "295° 8' 38.849''"
+    # sixty() must not change the direction
+    assert qiblah.sixty() == "295° 8' 38.849''"
+    assert qiblah.direction() == pytest.approx(295.1441246272677)
+    assert Qiblah(PrayerConf(106.843, -6.182, timezone)).direction() == qiblah.direction()